@@ -4,6 +4,20 @@ import uuid
 
 app = Flask(__name__)
 
+def sum_by_category(expenses_list):
+    """Sum amounts per category, returning (totals, error message or None)."""
+    totals = {}
+    for exp in expenses_list:
+        cat = exp.get('category')
+        amt = exp.get('amount')
+        if cat is None or amt is None:
+            return totals, "Each expense must have 'category' and 'amount'"
+        if not isinstance(amt, (int, float)):
+            return totals, "'amount' must be a number"
+
+        totals[cat] = totals.get(cat, 0.0) + amt
+    return totals, None
+
 @app.route('/aggregate-expenses', methods=['POST'])
 def aggregate_expenses():
     correlation_id = request.headers.get('X-Correlation-ID', str(uuid.uuid4()))
@@ -16,16 +30,9 @@ def aggregate_expenses():
 
     try:
         expenses_list = data['expenses']
-        totals = {}
-        for exp in expenses_list:
-            cat = exp.get('category')
-            amt = exp.get('amount')
-            if cat is None or amt is None:
-                return jsonify({"error": "Each expense must have 'category' and 'amount'"}), 400
-            if not isinstance(amt, (int, float)):
-                return jsonify({"error": "'amount' must be a number"}), 400
-
-            totals[cat] = totals.get(cat, 0.0) + amt
+        totals, error = sum_by_category(expenses_list)
+        if error:
+            return jsonify({"error": error}), 400
 
         # Omit zero or negative totals
         result = {cat: round(total, 2) for cat, total in totals.items() if total > 0}
@@ -0,0 +1,49 @@
+import importlib.util
+import os
+
+spec = importlib.util.spec_from_file_location(
+    'aggregate_expenses_app', os.path.join(os.path.dirname(__file__), 'app.py'))
+service = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(service)
+client = service.app.test_client()
+
+def post(expenses):
+    return client.post('/aggregate-expenses', json={"expenses": expenses},
+                       headers={'X-Correlation-ID': 'test'})
+
+def test_totals_per_category():
+    expenses = [{"category": "Food", "amount": 0.1}] * 10000 + [{"category": "Rent", "amount": 500}]
+    response = post(expenses)
+    assert response.status_code == 200
+    assert response.get_json() == {"Food": 1000.0, "Rent": 500.0, "correlationId": "test"}
+
+def test_omits_non_positive_totals():
+    response = post([{"category": "Refund", "amount": -5}, {"category": "Food", "amount": 5}])
+    assert response.get_json() == {"Food": 5.0, "correlationId": "test"}
+
+def test_first_invalid_expense_sets_error():
+    expenses = [{"category": "Food", "amount": 1}] * 5000
+    expenses += [{"category": "Food", "amount": "1"}, {"category": None, "amount": 1}]
+    response = post(expenses)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "'amount' must be a number"}
+
+def test_missing_category_error():
+    response = post([{"category": "Food", "amount": 1}, {"amount": 1}])
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Each expense must have 'category' and 'amount'"}
+
+def test_non_dict_expense_fails():
+    response = post([{"category": "Food", "amount": 1}, 5])
+    assert response.status_code == 500
+
+def test_unhashable_category_fails():
+    response = post([{"category": ["Food"], "amount": 1}])
+    assert response.status_code == 500
+
+def test_sum_by_category_matches_serial_loop():
+    expenses = [{"category": c, "amount": i * 0.01} for i, c in enumerate(["A", "B", "C"] * 1000)]
+    expected = {}
+    for exp in expenses:
+        expected[exp['category']] = expected.get(exp['category'], 0.0) + exp['amount']
+    assert service.sum_by_category(expenses) == (expected, None)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Measure whether sharding expense sums across processes pays off.
+
+Times the serial helpers of the aggregate_expenses and daily_limit services
+against a spawn-context process pool at 2, 4, ... up to os.cpu_count()
+workers, checks that both paths give the same results, and reports the cost
+of pickling the payload, which any process pool has to pay before a worker
+can start.
+
+Usage: python benchmark.py [number_of_expenses]
+"""
+from concurrent.futures import ProcessPoolExecutor
+import math
+import multiprocessing
+import os
+import pickle
+import random
+import sys
+import time
+
+from aggregate_expenses.app import sum_by_category
+from daily_limit.app import sum_amounts
+
+CATEGORIES = ['Food', 'Rent', 'Transport', 'Utilities', 'Entertainment', 'Health']
+
+def make_expenses(count):
+    rng = random.Random(361)
+    return [{"category": rng.choice(CATEGORIES), "amount": round(rng.uniform(1, 200), 2)}
+            for _ in range(count)]
+
+def shards(expenses, workers):
+    size = -(-len(expenses) // workers)
+    return [expenses[i:i + size] for i in range(0, len(expenses), size)]
+
+def sharded_totals(expenses, pool, workers):
+    partials = list(pool.map(sum_by_category, shards(expenses, workers)))
+    return {cat: math.fsum(p[cat] for p, _ in partials if cat in p)
+            for cat in {cat for p, _ in partials for cat in p}}
+
+def sharded_sum(expenses, pool, workers):
+    return math.fsum(pool.map(sum_amounts, shards(expenses, workers)))
+
+def best_of(func, repeats=3):
+    best, result = None, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    expenses = make_expenses(count)
+    cores = os.cpu_count() or 1
+    print(f"{count} expenses, {cores} cores")
+
+    serial_agg, (totals, _) = best_of(lambda: sum_by_category(expenses))
+    serial_sum, total = best_of(lambda: sum_amounts(expenses))
+    dumps, payload = best_of(lambda: pickle.dumps(expenses))
+    loads, _ = best_of(lambda: pickle.loads(payload))
+    print(f"serial sum_by_category : {serial_agg:.3f}s")
+    print(f"serial sum_amounts     : {serial_sum:.3f}s")
+    print(f"pickle.dumps payload   : {dumps:.3f}s")
+    print(f"pickle.loads payload   : {loads:.3f}s")
+
+    rounded = {cat: round(amt, 2) for cat, amt in totals.items()}
+    context = multiprocessing.get_context('spawn')
+    for workers in sorted(({2 ** i for i in range(1, cores.bit_length())} | {cores}) - {1}):
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            list(pool.map(sum_amounts, [[]] * workers))  # warm up the workers
+            agg, sharded = best_of(lambda: sharded_totals(expenses, pool, workers))
+            amt, sharded_total = best_of(lambda: sharded_sum(expenses, pool, workers))
+        same = ({cat: round(v, 2) for cat, v in sharded.items()} == rounded
+                and round(sharded_total, 2) == round(total, 2))
+        print(f"{workers:2d} workers: aggregate {agg:.3f}s (x{serial_agg / agg:.2f}), "
+              f"daily limit {amt:.3f}s (x{serial_sum / amt:.2f}), results match: {same}")
+
+if __name__ == '__main__':
+    main()
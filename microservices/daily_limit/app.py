@@ -5,6 +5,10 @@ import uuid
 
 app = Flask(__name__)
 
+def sum_amounts(expenses):
+    """Add up the 'amount' of every expense."""
+    return sum(expense['amount'] for expense in expenses)
+
 @app.route('/daily-limit', methods=['POST'])
 def calculate():
     try:
@@ -25,7 +29,7 @@ def calculate():
                 return jsonify({"error": f"Missing required field: {field}"}), 400
         
         # Calculate total expenses
-        total_expenses = sum(expense['amount'] for expense in data['expenses'])
+        total_expenses = sum_amounts(data['expenses'])
         
         # Calculate remaining budget
         remaining_budget = data['totalBudget'] - data['reserve'] - total_expenses
@@ -0,0 +1,42 @@
+import importlib.util
+import os
+
+spec = importlib.util.spec_from_file_location(
+    'daily_limit_app', os.path.join(os.path.dirname(__file__), 'app.py'))
+service = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(service)
+client = service.app.test_client()
+
+def post(expenses, **overrides):
+    body = {"totalBudget": 1000, "reserve": 100, "expenses": expenses,
+            "endDate": "2025-01-10", "currentDate": "2025-01-01"}
+    body.update(overrides)
+    return client.post('/daily-limit', json=body, headers={'X-Correlation-ID': 'test'})
+
+def test_daily_limit_from_expense_sum():
+    response = post([{"amount": 0.1}] * 3000)
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data['remainingBudget'] == 900 - sum(0.1 for _ in range(3000))
+    assert data['remainingDays'] == 10
+    assert data['dailyLimit'] == 60.0
+    assert data['status'] == "ok"
+
+def test_warning_near_budget():
+    data = post([{"amount": 750}]).get_json()
+    assert data['remainingBudget'] == 150
+    assert data['status'] == "warning"
+
+def test_period_ended():
+    data = post([{"amount": 10}], currentDate="2025-01-11").get_json()
+    assert data['dailyLimit'] == 0.0
+    assert data['remainingDays'] == 0
+
+def test_expense_without_amount_fails():
+    response = post([{"amount": 10}, {"category": "Food"}])
+    assert response.status_code == 500
+    assert response.get_json() == {"error": "'amount'"}
+
+def test_sum_amounts_matches_builtin_sum():
+    expenses = [{"amount": i * 0.01} for i in range(1000)]
+    assert service.sum_amounts(expenses) == sum(e['amount'] for e in expenses)